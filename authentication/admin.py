@@ -22,6 +22,7 @@ admin.site.register(User, UserAdmin)
 @admin.register(SavedJob)
 class SavedJobAdmin(admin.ModelAdmin):
     list_display = ('user', 'title', 'company', 'location', 'saved_at')
+    list_select_related = ('user',)
     list_filter = ('saved_at',)
     search_fields = ('user__username', 'title', 'company', 'location')
     ordering = ('-saved_at',)
@@ -29,6 +30,7 @@ class SavedJobAdmin(admin.ModelAdmin):
 @admin.register(SearchHistory)
 class SearchHistoryAdmin(admin.ModelAdmin):
     list_display = ('user', 'query', 'location', 'remote_only', 'searched_at')
+    list_select_related = ('user',)
     list_filter = ('remote_only', 'searched_at')
     search_fields = ('user__username', 'query', 'location')
     ordering = ('-searched_at',)
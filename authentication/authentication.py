@@ -0,0 +1,10 @@
+from rest_framework_simplejwt import authentication as jwt_authentication
+from .models import UserWithProfile
+
+
+class JWTAuthentication(jwt_authentication.JWTAuthentication):
+    """JWT authentication that loads the user's profile along with the user row."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user_model = UserWithProfile
@@ -0,0 +1,92 @@
+from copy import copy
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from rest_framework import fields as drf_fields
+from rest_framework.serializers import BaseSerializer
+
+# Field types whose to_representation() returns model attribute values unchanged
+_PASSTHROUGH_FIELD_TYPES = (
+    drf_fields.CharField,
+    drf_fields.EmailField,
+    drf_fields.URLField,
+    drf_fields.IntegerField,
+)
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer class's fields once and hand out shallow copies.
+
+    ModelSerializer.get_fields() introspects the model and deep-copies the
+    declared fields every time a serializer is instantiated. The result only
+    depends on the serializer class, so it is cached per class here; each
+    instance still gets its own field objects to bind.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        fields = self._fields_cache.get(cls)
+        if fields is None:
+            fields = self._fields_cache[cls] = super().get_fields()
+        return {name: copy(field) for name, field in fields.items()}
+
+
+class CompiledRepresentationMixin:
+    """
+    Render model instances with a function generated for the serializer.
+
+    Serializer.to_representation() resolves every field's source through
+    get_attribute() and dispatches to the field's to_representation(), which
+    for plain model columns is the same work on every object. The first call
+    generates a function that reads those columns straight off the instance;
+    fields that do convert their value (dates, files, nested serializers)
+    still go through the bound field. Serializers with any other kind of
+    source fall back to the generic implementation.
+    """
+    _representation_cache = {}
+
+    def to_representation(self, instance):
+        cls = type(self)
+        func = self._representation_cache.get(cls)
+        if func is None:
+            func = self._representation_cache[cls] = self._compile_representation()
+        if func is False or not isinstance(instance, models.Model):
+            return super().to_representation(instance)
+        return func(self.fields, instance)
+
+    def _compile_representation(self):
+        opts = self.Meta.model._meta
+        body, items = [], []
+
+        for index, field in enumerate(self._readable_fields):
+            name, source = field.field_name, field.source
+            try:
+                model_field = opts.get_field(source)
+            except FieldDoesNotExist:
+                return False
+
+            if isinstance(field, BaseSerializer):
+                # Reverse one-to-one accessors raise when the row is missing,
+                # which get_attribute() reports as None
+                body.append(f'    v{index} = getattr(obj, {source!r}, None)')
+            elif model_field.concrete and not model_field.is_relation:
+                if type(field) in _PASSTHROUGH_FIELD_TYPES:
+                    items.append(f'        {name!r}: obj.{source},')
+                    continue
+                body.append(f'    v{index} = obj.{source}')
+            else:
+                return False
+
+            items.append(
+                f'        {name!r}: None if v{index} is None '
+                f'else fields[{name!r}].to_representation(v{index}),'
+            )
+
+        source_code = '\n'.join(
+            ['def to_representation(fields, obj):', *body, '    return {', *items, '    }']
+        )
+        namespace = {}
+        exec(compile(source_code, f'<{type(self).__name__}.to_representation>', 'exec'), namespace)
+        return namespace['to_representation']
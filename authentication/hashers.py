@@ -0,0 +1,14 @@
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class OWASPArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with the OWASP minimum parameters (19 MiB, t=2, p=1).
+
+    Django's defaults (100 MiB, p=8) cost about as much wall time per hash as
+    PBKDF2 on the single-core instances we deploy to. Argon2's memory
+    hardness, not the iteration count, is what resists GPU cracking.
+    """
+    time_cost = 2
+    memory_cost = 19456
+    parallelism = 1
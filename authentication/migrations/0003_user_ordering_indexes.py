@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0002_skillshistory'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='savedjob',
+            index=models.Index(fields=['user', '-saved_at'], name='authenticat_user_id_619670_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='searchhistory',
+            index=models.Index(fields=['user', '-searched_at'], name='authenticat_user_id_95044f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skillshistory',
+            index=models.Index(fields=['user', '-extracted_at'], name='authenticat_user_id_1fa9a6_idx'),
+        ),
+    ]
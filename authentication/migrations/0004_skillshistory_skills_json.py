@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:42
+
+import json
+
+from django.db import migrations, models
+
+
+def encode_plain_text_skills(apps, schema_editor):
+    """Wrap rows that were not stored as valid JSON so the column can be cast."""
+    SkillsHistory = apps.get_model('authentication', 'SkillsHistory')
+    for entry in SkillsHistory.objects.only('id', 'skills').iterator():
+        try:
+            json.loads(entry.skills)
+        except (TypeError, ValueError):
+            SkillsHistory.objects.filter(pk=entry.pk).update(skills=json.dumps(entry.skills))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0003_user_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(encode_plain_text_skills, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='skillshistory',
+            name='skills',
+            field=models.JSONField(default=list),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:44
+
+import authentication.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('authentication', '0004_skillshistory_skills_json'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserWithProfile',
+            fields=[
+            ],
+            options={
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('auth.user',),
+            managers=[
+                ('objects', authentication.models.UserWithProfileManager()),
+            ],
+        ),
+    ]
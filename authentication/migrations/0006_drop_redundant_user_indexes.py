@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:45
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('authentication', '0005_userwithprofile'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='savedjob',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='saved_jobs', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='searchhistory',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='search_history', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='skillshistory',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='skills_history', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
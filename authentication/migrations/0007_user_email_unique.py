@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    auth.User is not swapped in this project, so the case-insensitive email
+    uniqueness that registration relies on is added to its table directly.
+    Blank emails (e.g. superusers created without one) are left out.
+    """
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('authentication', '0006_drop_redundant_user_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE UNIQUE INDEX user_email_uniq ON auth_user (LOWER(email)) WHERE email <> ''",
+            reverse_sql="DROP INDEX user_email_uniq",
+        ),
+    ]
@@ -1,7 +1,5 @@
 from django.db import models
-from django.contrib.auth.models import User
-from django.db.models.signals import post_save
-from django.dispatch import receiver
+from django.contrib.auth.models import User, UserManager
 
 class UserProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
@@ -18,32 +16,33 @@ class UserProfile(models.Model):
     def __str__(self):
         return f"{self.user.username}'s profile"
 
+class UserWithProfileManager(UserManager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('profile')
+
+class UserWithProfile(User):
+    """User proxy that always loads the profile in the same query."""
+    objects = UserWithProfileManager()
+
+    class Meta:
+        proxy = True
+
 class SkillsHistory(models.Model):
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='skills_history')
-    skills = models.TextField()  # Stored as JSON string
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='skills_history', db_index=False)
+    skills = models.JSONField(default=list)
     extracted_at = models.DateTimeField(auto_now_add=True)
     resume_name = models.CharField(max_length=255, blank=True)
 
     class Meta:
         ordering = ['-extracted_at']
+        indexes = [models.Index(fields=['user', '-extracted_at'])]
         verbose_name_plural = "Skills histories"
 
     def __str__(self):
         return f"{self.user.username}'s skills - {self.extracted_at.strftime('%Y-%m-%d %H:%M')}"
 
-@receiver(post_save, sender=User)
-def create_user_profile(sender, instance, created, **kwargs):
-    """Create a user profile when a new user is created."""
-    if created:
-        UserProfile.objects.create(user=instance)
-
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """Save the user profile when the user is saved."""
-    instance.profile.save()
-
 class SavedJob(models.Model):
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_jobs')
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_jobs', db_index=False)
     job_id = models.CharField(max_length=255)
     title = models.CharField(max_length=255)
     company = models.CharField(max_length=255)
@@ -55,12 +54,13 @@ class SavedJob(models.Model):
     class Meta:
         unique_together = ('user', 'job_id')
         ordering = ['-saved_at']
+        indexes = [models.Index(fields=['user', '-saved_at'])]
 
     def __str__(self):
         return f"{self.user.username} - {self.title} at {self.company}"
 
 class SearchHistory(models.Model):
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='search_history')
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='search_history', db_index=False)
     query = models.CharField(max_length=255)
     location = models.CharField(max_length=255, blank=True)
     remote_only = models.BooleanField(default=False)
@@ -68,6 +68,7 @@ class SearchHistory(models.Model):
 
     class Meta:
         ordering = ['-searched_at']
+        indexes = [models.Index(fields=['user', '-searched_at'])]
         verbose_name_plural = "Search histories"
 
     def __str__(self):
@@ -1,15 +1,35 @@
+import json
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.db import IntegrityError, transaction
 from django.contrib.auth.password_validation import validate_password
+from .fast_serializers import CachedFieldsMixin, CompiledRepresentationMixin
 from .models import UserProfile, SavedJob, SearchHistory, SkillsHistory
 
-class UserProfileSerializer(serializers.ModelSerializer):
+def _taken_field(user, fields, exclude_pk=None):
+    """
+    Name the first of ``fields`` whose value another user already holds. Only
+    called after a unique violation, so the common path stays lookup-free.
+    """
+    others = User.objects.all() if exclude_pk is None else User.objects.exclude(pk=exclude_pk)
+    for field in fields:
+        value = getattr(user, field)
+        if field == 'email':
+            # Mirrors user_email_uniq: case-insensitive and blank emails exempt
+            if value and others.filter(email__iexact=value).exists():
+                return field
+        elif others.filter(**{field: value}).exists():
+            return field
+    return None
+
+class UserProfileSerializer(CachedFieldsMixin, CompiledRepresentationMixin, serializers.ModelSerializer):
     class Meta:
         model = UserProfile
         fields = ['bio', 'location', 'birth_date', 'profile_picture',
                   'linkedin_url', 'github_url', 'website']
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsMixin, CompiledRepresentationMixin, serializers.ModelSerializer):
     profile = UserProfileSerializer(required=False)
 
     class Meta:
@@ -30,21 +50,29 @@ class RegisterSerializer(serializers.ModelSerializer):
         if attrs['password'] != attrs['password2']:
             raise serializers.ValidationError({"password": "Password fields didn't match."})
 
-        if User.objects.filter(email=attrs['email']).exists():
-            raise serializers.ValidationError({"email": "A user with that email already exists."})
-
         return attrs
 
     def create(self, validated_data):
-        user = User.objects.create(
+        user = User(
             username=validated_data['username'],
             email=validated_data['email'],
             first_name=validated_data.get('first_name', ''),
             last_name=validated_data.get('last_name', '')
         )
-
         user.set_password(validated_data['password'])
-        user.save()
+
+        # Email uniqueness is enforced by the user_email_uniq index rather than
+        # a separate lookup, so a taken email surfaces as an IntegrityError here.
+        # A username taken since validation lands here too.
+        try:
+            with transaction.atomic():
+                user.save()
+                UserProfile.objects.create(user=user)
+        except IntegrityError:
+            field = _taken_field(user, ('username', 'email'))
+            if field is None:
+                raise
+            raise serializers.ValidationError({field: [f"A user with that {field} already exists."]})
 
         return user
 
@@ -65,18 +93,9 @@ class UpdateUserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['username', 'email', 'first_name', 'last_name', 'profile']
-
-    def validate_email(self, value):
-        user = self.context['request'].user
-        if User.objects.exclude(pk=user.pk).filter(email=value).exists():
-            raise serializers.ValidationError({"email": "This email is already in use."})
-        return value
-
-    def validate_username(self, value):
-        user = self.context['request'].user
-        if User.objects.exclude(pk=user.pk).filter(username=value).exists():
-            raise serializers.ValidationError({"username": "This username is already in use."})
-        return value
+        # Username and email uniqueness is enforced by the auth_user unique
+        # indexes at save time rather than by a lookup per field
+        extra_kwargs = {'username': {'validators': [UnicodeUsernameValidator()]}}
 
     def update(self, instance, validated_data):
         profile_data = validated_data.pop('profile', None)
@@ -84,31 +103,72 @@ class UpdateUserSerializer(serializers.ModelSerializer):
         # Update User fields
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        # Only write the columns the client sent
+        if validated_data:
+            # The savepoint keeps the transaction usable for the conflict lookup
+            try:
+                with transaction.atomic():
+                    instance.save(update_fields=list(validated_data))
+            except IntegrityError:
+                changed = [f for f in ('username', 'email') if f in validated_data]
+                field = _taken_field(instance, changed, exclude_pk=instance.pk)
+                if field is None:
+                    raise
+                raise serializers.ValidationError({field: [f"This {field} is already in use."]})
 
         # Update UserProfile fields
         if profile_data:
+            # Accounts created outside RegisterSerializer may not have a profile yet
+            profile = getattr(instance, 'profile', None) or UserProfile(user=instance)
             for attr, value in profile_data.items():
-                setattr(instance.profile, attr, value)
-            instance.profile.save()
+                setattr(profile, attr, value)
+            if profile.pk is None:
+                profile.save()
+            else:
+                # auto_now only fires for fields listed in update_fields
+                profile.save(update_fields=[*profile_data, 'updated_at'])
 
         return instance
 
-class SavedJobSerializer(serializers.ModelSerializer):
+class SavedJobSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = SavedJob
         fields = ['id', 'job_id', 'title', 'company', 'location', 'description',
                   'job_apply_link', 'saved_at']
         read_only_fields = ['id', 'saved_at']
 
-class SearchHistorySerializer(serializers.ModelSerializer):
+SAVED_JOB_LIST_FIELDS = ['id', 'job_id', 'title', 'company', 'location', 'job_apply_link', 'saved_at']
+
+class SavedJobListSerializer(CachedFieldsMixin, serializers.Serializer):
+    """
+    Saved job row for list responses, rendered from .values() dicts so no model
+    instances are built. The full description is only served by the detail view.
+    """
+    id = serializers.IntegerField(read_only=True)
+    job_id = serializers.CharField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    company = serializers.CharField(read_only=True)
+    location = serializers.CharField(read_only=True)
+    job_apply_link = serializers.URLField(read_only=True)
+    saved_at = serializers.DateTimeField(read_only=True)
+
+class SearchHistorySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = SearchHistory
         fields = ['id', 'query', 'location', 'remote_only', 'searched_at']
         read_only_fields = ['id', 'searched_at']
 
-class SkillsHistorySerializer(serializers.ModelSerializer):
+class SkillsHistorySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = SkillsHistory
         fields = ['id', 'skills', 'extracted_at', 'resume_name']
         read_only_fields = ['id', 'extracted_at']
+
+    def validate_skills(self, value):
+        # Older clients send the skills list pre-encoded as a JSON string
+        if isinstance(value, str):
+            try:
+                return json.loads(value)
+            except ValueError:
+                pass
+        return value
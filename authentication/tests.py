@@ -1,3 +1,83 @@
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from .models import SearchHistory, SkillsHistory
+from .serializers import RegisterSerializer
+
+
+class ClearHistoryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('alice', 'alice@example.com', 'pw')
+        self.other = User.objects.create_user('bob', 'bob@example.com', 'pw')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_clear_search_history_issues_single_delete(self):
+        for user in (self.user, self.user, self.other):
+            SearchHistory.objects.create(user=user, query='python')
+
+        with self.assertNumQueries(1):
+            response = self.client.delete(reverse('search_history_clear'))
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(SearchHistory.objects.filter(user=self.user).exists())
+        self.assertEqual(SearchHistory.objects.filter(user=self.other).count(), 1)
+
+    def test_clear_skills_history_issues_single_delete(self):
+        for user in (self.user, self.user, self.other):
+            SkillsHistory.objects.create(user=user, skills=['python'])
+
+        with self.assertNumQueries(1):
+            response = self.client.delete(reverse('skills_history_clear'))
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(SkillsHistory.objects.filter(user=self.user).exists())
+        self.assertEqual(SkillsHistory.objects.filter(user=self.other).count(), 1)
+
+
+class RegisterConflictTests(TestCase):
+    def setUp(self):
+        User.objects.create_user('alice', 'Alice@Example.com', 'pw')
+
+    def register(self, **overrides):
+        data = {'username': 'carol', 'email': 'carol@example.com', 'password': 'pw'}
+        data.update(overrides)
+        return RegisterSerializer().create(data)
+
+    def test_taken_email_is_reported_on_email(self):
+        with self.assertRaises(ValidationError) as ctx:
+            self.register(email='alice@example.com')
+        self.assertEqual(list(ctx.exception.detail), ['email'])
+
+    def test_taken_username_is_reported_on_username(self):
+        # Bypasses validate() to simulate a username taken after validation
+        with self.assertRaises(ValidationError) as ctx:
+            self.register(username='alice')
+        self.assertEqual(list(ctx.exception.detail), ['username'])
+
+
+class UpdateUserConflictTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('carol', 'carol@example.com', 'pw')
+        User.objects.create_user('email_admin', 'Alice@Example.com', 'pw')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_taken_username_is_reported_on_username(self):
+        # The taken value mentions "email", which used to fool the check
+        response = self.client.patch(reverse('user_update'), {'username': 'email_admin'}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(response.data), ['username'])
+
+    def test_taken_email_is_reported_on_email(self):
+        response = self.client.patch(reverse('user_update'), {'email': 'alice@example.com'}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(response.data), ['email'])
+
+    def test_keeping_own_values_is_not_a_conflict(self):
+        response = self.client.patch(
+            reverse('user_update'), {'username': 'carol', 'email': 'CAROL@example.com'}, format='json')
+        self.assertEqual(response.status_code, 200)
@@ -7,7 +7,8 @@ from .views import (
     RegisterView, LogoutView, ChangePasswordView, UserDetailView, UpdateUserView,
     SavedJobListCreateView, SavedJobDetailView, SearchHistoryListView,
     SearchHistoryCreateView, SearchHistoryClearView, SkillsHistoryListView,
-    SkillsHistoryCreateView, SkillsHistoryDetailView, SkillsHistoryClearView
+    SkillsHistoryCreateView, SkillsHistoryDetailView, SkillsHistoryClearView,
+    DashboardView
 )
 
 urlpatterns = [
@@ -36,4 +37,7 @@ urlpatterns = [
     path('skills-history/<int:pk>/', SkillsHistoryDetailView.as_view(), name='skills_history_detail'),
     path('skills-history/create/', SkillsHistoryCreateView.as_view(), name='skills_history_create'),
     path('skills-history/clear/', SkillsHistoryClearView.as_view(), name='skills_history_clear'),
+
+    # Dashboard endpoint
+    path('dashboard/', DashboardView.as_view(), name='dashboard'),
 ]
@@ -1,16 +1,44 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from rest_framework import generics, status, permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth.models import User
+from django.utils.functional import cached_property
+from django.db import close_old_connections
 from .serializers import (
     UserSerializer, RegisterSerializer, ChangePasswordSerializer,
-    UpdateUserSerializer, SavedJobSerializer, SearchHistorySerializer,
-    SkillsHistorySerializer
+    UpdateUserSerializer, SavedJobSerializer, SavedJobListSerializer,
+    SearchHistorySerializer, SkillsHistorySerializer, SAVED_JOB_LIST_FIELDS
 )
 from .models import SavedJob, SearchHistory, SkillsHistory
 
+logger = logging.getLogger(__name__)
+
+_blacklist_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='token-blacklist')
+
+def _blacklist_token(token):
+    try:
+        token.blacklist()
+    except Exception:
+        logger.exception("Failed to blacklist refresh token")
+    finally:
+        close_old_connections()
+
+class UserFilteredMixin:
+    """Scope a view's queryset to the rows owned by the requesting user."""
+    model = None
+
+    @cached_property
+    def user(self):
+        # request.user is a lazy object; resolve it once per request
+        return self.request.user
+
+    def get_queryset(self):
+        return self.model.objects.filter(user=self.user)
+
 class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
     permission_classes = (AllowAny,)
@@ -23,7 +51,9 @@ class LogoutView(APIView):
         try:
             refresh_token = request.data["refresh"]
             token = RefreshToken(refresh_token)
-            token.blacklist()
+            # The client drops its tokens on logout, so it does not need to
+            # wait for the blacklist row to be written
+            _blacklist_executor.submit(_blacklist_token, token)
             return Response(status=status.HTTP_205_RESET_CONTENT)
         except Exception as e:
             return Response(status=status.HTTP_400_BAD_REQUEST)
@@ -45,7 +75,7 @@ class ChangePasswordView(generics.UpdateAPIView):
                             status=status.HTTP_400_BAD_REQUEST)
 
         user.set_password(serializer.validated_data['new_password'])
-        user.save()
+        user.save(update_fields=['password'])
 
         return Response({"detail": "Password updated successfully"},
                         status=status.HTTP_200_OK)
@@ -64,68 +94,108 @@ class UpdateUserView(generics.UpdateAPIView):
     def get_object(self):
         return self.request.user
 
-class SavedJobListCreateView(generics.ListCreateAPIView):
+class SavedJobListCreateView(UserFilteredMixin, generics.ListCreateAPIView):
+    model = SavedJob
     serializer_class = SavedJobSerializer
     permission_classes = (IsAuthenticated,)
 
+    def get_serializer_class(self):
+        if self.request.method == 'GET':
+            return SavedJobListSerializer
+        return SavedJobSerializer
+
     def get_queryset(self):
-        return SavedJob.objects.filter(user=self.request.user)
+        return super().get_queryset().values(*SAVED_JOB_LIST_FIELDS)
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
-
-class SavedJobDetailView(generics.RetrieveDestroyAPIView):
+        # Saving a job twice is a common double click, so let the (user, job_id)
+        # unique constraint absorb it instead of surfacing an IntegrityError
+        SavedJob.objects.bulk_create(
+            [SavedJob(user=self.user, **serializer.validated_data)],
+            ignore_conflicts=True
+        )
+        serializer.instance = SavedJob.objects.get(
+            user=self.user, job_id=serializer.validated_data['job_id']
+        )
+
+class SavedJobDetailView(UserFilteredMixin, generics.RetrieveDestroyAPIView):
+    model = SavedJob
     serializer_class = SavedJobSerializer
     permission_classes = (IsAuthenticated,)
 
-    def get_queryset(self):
-        return SavedJob.objects.filter(user=self.request.user)
-
-class SearchHistoryListView(generics.ListAPIView):
+class SearchHistoryListView(UserFilteredMixin, generics.ListAPIView):
+    model = SearchHistory
     serializer_class = SearchHistorySerializer
     permission_classes = (IsAuthenticated,)
 
     def get_queryset(self):
-        return SearchHistory.objects.filter(user=self.request.user)
+        return super().get_queryset().only(
+            *SearchHistorySerializer.Meta.fields
+        )
 
-class SearchHistoryCreateView(generics.CreateAPIView):
+class SearchHistoryCreateView(UserFilteredMixin, generics.CreateAPIView):
+    model = SearchHistory
     serializer_class = SearchHistorySerializer
     permission_classes = (IsAuthenticated,)
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        serializer.save(user=self.user)
 
-class SearchHistoryClearView(APIView):
+class SearchHistoryClearView(UserFilteredMixin, APIView):
+    model = SearchHistory
     permission_classes = (IsAuthenticated,)
 
     def delete(self, request):
-        SearchHistory.objects.filter(user=request.user).delete()
+        # No cascades or delete signals hang off SearchHistory, so skip the collector
+        queryset = self.get_queryset()
+        queryset._raw_delete(queryset.db)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-class SkillsHistoryListView(generics.ListAPIView):
+class SkillsHistoryListView(UserFilteredMixin, generics.ListAPIView):
+    model = SkillsHistory
     serializer_class = SkillsHistorySerializer
     permission_classes = (IsAuthenticated,)
 
     def get_queryset(self):
-        return SkillsHistory.objects.filter(user=self.request.user)
+        return super().get_queryset().only(
+            *SkillsHistorySerializer.Meta.fields
+        )
 
-class SkillsHistoryCreateView(generics.CreateAPIView):
+class SkillsHistoryCreateView(UserFilteredMixin, generics.CreateAPIView):
+    model = SkillsHistory
     serializer_class = SkillsHistorySerializer
     permission_classes = (IsAuthenticated,)
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        serializer.save(user=self.user)
 
-class SkillsHistoryDetailView(generics.RetrieveAPIView):
+class SkillsHistoryDetailView(UserFilteredMixin, generics.RetrieveAPIView):
+    model = SkillsHistory
     serializer_class = SkillsHistorySerializer
     permission_classes = (IsAuthenticated,)
 
-    def get_queryset(self):
-        return SkillsHistory.objects.filter(user=self.request.user)
-
-class SkillsHistoryClearView(APIView):
+class SkillsHistoryClearView(UserFilteredMixin, APIView):
+    model = SkillsHistory
     permission_classes = (IsAuthenticated,)
 
     def delete(self, request):
-        SkillsHistory.objects.filter(user=request.user).delete()
+        # No cascades or delete signals hang off SkillsHistory, so skip the collector
+        queryset = self.get_queryset()
+        queryset._raw_delete(queryset.db)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+class DashboardView(APIView):
+    permission_classes = (IsAuthenticated,)
+    recent_limit = 5
+
+    def get(self, request):
+        user = request.user
+        saved_jobs = SavedJob.objects.filter(user=user).values(*SAVED_JOB_LIST_FIELDS)
+        searches = SearchHistory.objects.filter(user=user).only(*SearchHistorySerializer.Meta.fields)
+        skills = SkillsHistory.objects.filter(user=user).only(*SkillsHistorySerializer.Meta.fields)
+
+        return Response({
+            'saved_jobs': SavedJobListSerializer(saved_jobs[:self.recent_limit], many=True).data,
+            'search_history': SearchHistorySerializer(searches[:self.recent_limit], many=True).data,
+            'skills_history': SkillsHistorySerializer(skills[:self.recent_limit], many=True).data,
+        })
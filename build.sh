@@ -8,5 +8,8 @@ pip install -r requirements.txt
 # Apply database migrations
 python manage.py migrate
 
+# Convert the job listings CSV to Parquet for faster loading
+python manage.py build_job_listings
+
 # Collect static files
 python manage.py collectstatic --no-input
@@ -0,0 +1,12 @@
+"""
+Gunicorn settings, picked up automatically when gunicorn starts in the project root.
+
+Resume parsing and the FindWork and Coursera calls keep a request busy for a
+long time. With threaded workers a process keeps serving other requests while
+one of them waits, instead of capping concurrency at the number of workers.
+The process count still comes from WEB_CONCURRENCY.
+"""
+import os
+
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', '4'))
@@ -0,0 +1,18 @@
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSONParser that decodes with orjson.
+
+    orjson only accepts UTF-8 and, like JSONParser with STRICT_JSON, rejects
+    NaN and Infinity.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,31 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+_default_encoder = encoders.JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson.
+
+    Types orjson does not know natively (lazy translations, Decimal, querysets,
+    ...) go through DRF's JSONEncoder. Indented output, as requested by the
+    browsable API, and anything orjson rejects outright use the stock renderer.
+    """
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_default_encoder.default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escape U+2028/U+2029 like JSONRenderer so the output stays valid JavaScript
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -1,6 +1,43 @@
+import logging
+import os
+
 from django.apps import AppConfig
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Written when Job_listings.csv is missing so the recommendation views have data
+SAMPLE_JOB_LISTINGS = {
+    'id': ['1', '2', '3'],
+    'title': ['Software Engineer', 'Data Scientist', 'Web Developer'],
+    'company': ['Tech Co', 'Data Inc', 'Web LLC'],
+    'location': ['San Francisco', 'New York', 'Remote'],
+    'description': ['Software engineering role', 'Data science position', 'Web development job'],
+    'Skills': ['python, javascript', 'python, sql, machine learning', 'html, css, javascript, react']
+}
+
+
+def ensure_job_listings(path):
+    """
+    Create a sample job listings file if none exists at the given path.
+
+    Args:
+        path (str): Path to the job listings CSV file
+    """
+    if os.path.exists(path):
+        return
+
+    import pandas as pd
+
+    logger.warning("Job listings file not found at %s, creating sample data", path)
+    pd.DataFrame(SAMPLE_JOB_LISTINGS).to_csv(path, index=False)
+    logger.info("Created sample job listings file")
 
 
 class JobMatcherConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'job_matcher'
+
+    def ready(self):
+        # Checked once per process rather than on every recommendation request
+        ensure_job_listings(os.path.join(settings.BASE_DIR, 'Job_listings.csv'))
@@ -0,0 +1,49 @@
+"""
+Management command that converts the job listings CSV to Parquet.
+
+The views load Job_listings.parquet instead of the CSV whenever it is at
+least as new, which skips CSV tokenizing and dtype inference and the spaCy
+pass that derives the Skills column. The TF-IDF vectors fitted on the
+listings are saved next to it so worker processes do not refit them.
+"""
+import os
+
+import joblib
+import pandas as pd
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from job_matcher.views import extract_skills_batch, fit_job_vectors, parquet_path_for, vectors_path_for
+
+
+class Command(BaseCommand):
+    help = "Convert Job_listings.csv to a zstd-compressed Parquet file with a Skills column"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--csv',
+            default=os.path.join(settings.BASE_DIR, 'Job_listings.csv'),
+            help="Path to the job listings CSV file"
+        )
+
+    def handle(self, *args, **options):
+        csv_path = options['csv']
+        if not os.path.exists(csv_path):
+            raise CommandError(f"Job listings file not found at {csv_path}")
+
+        job_listings = pd.read_csv(csv_path)
+        if 'Skills' not in job_listings.columns:
+            job_listings['Skills'] = extract_skills_batch(job_listings['description'].tolist())
+
+        parquet_path = parquet_path_for(csv_path)
+        job_listings.to_parquet(parquet_path, compression='zstd', index=False)
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {len(job_listings)} job listings to {parquet_path}"
+        ))
+
+        # Saved after the Parquet file so the views see the vectors as current
+        job_vectors = fit_job_vectors(job_listings)
+        if job_vectors is not None:
+            vectors_path = vectors_path_for(csv_path)
+            joblib.dump(job_vectors, vectors_path)
+            self.stdout.write(self.style.SUCCESS(f"Wrote job vectors to {vectors_path}"))
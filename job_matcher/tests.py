@@ -1,3 +1,91 @@
-from django.test import TestCase
+import os
+import shutil
+import tempfile
 
-# Create your tests here.
+import unittest
+
+import pandas as pd
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+import main
+from main import recommended_jobs
+from . import views
+from .apps import SAMPLE_JOB_LISTINGS, ensure_job_listings
+from .serializers import JobSerializer
+
+
+class JobListingsTestCase(SimpleTestCase):
+    """Points the views at a scratch Job_listings.csv for each test."""
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base_dir)
+        self.listings_path = os.path.join(self.base_dir, 'Job_listings.csv')
+        settings_override = override_settings(BASE_DIR=self.base_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        views._JOB_CACHE.clear()
+        self.addCleanup(views._JOB_CACHE.clear)
+        self.client = APIClient()
+
+
+class RecommendedJobsViewTests(JobListingsTestCase):
+    def setUp(self):
+        super().setUp()
+        listings = pd.DataFrame(SAMPLE_JOB_LISTINGS)
+        listings['job_apply_link'] = [f'https://jobs.example.com/apply/{i}' for i in listings['id']]
+        listings.to_csv(self.listings_path, index=False)
+
+    def test_matches_job_serializer_output(self):
+        skills = 'python, sql'
+        response = self.client.post(reverse('recommended-jobs'), {'skills': skills}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        job_listings, job_vectors = views._load_jobs(self.listings_path)
+        expected = recommended_jobs(skills, job_listings, job_vectors)
+        expected = expected.rename(columns={'Similarity Score': 'Similarity_Score'})
+        expected = expected.reindex(columns=list(JobSerializer().fields)).astype(object)
+        records = expected.where(expected.notna(), None).to_dict('records')
+
+        self.assertEqual(response.json(), JobSerializer(records, many=True).data)
+        self.assertIsInstance(response.json()[0]['id'], str)
+        self.assertNotIn(b'\\/', response.content)
+
+
+class JobLinksViewTests(JobListingsTestCase):
+    def test_sample_listings_without_providers_return_no_links(self):
+        ensure_job_listings(self.listings_path)
+        response = self.client.post(reverse('job-links'), {'jobs': ['1', '2']}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
+
+    def test_returns_provider_links_for_requested_jobs(self):
+        listings = pd.DataFrame(SAMPLE_JOB_LISTINGS)
+        listings['jobProviders'] = [
+            repr([{'jobProvider': f'Board {i}', 'url': f'https://jobs.example.com/{i}'}])
+            for i in listings['id']
+        ]
+        listings.to_csv(self.listings_path, index=False)
+        response = self.client.post(reverse('job-links'), {'jobs': ['2']}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [{'jobProvider': 'Board 2', 'url': 'https://jobs.example.com/2'}])
+
+
+class KeywordSkillsTests(SimpleTestCase):
+    @unittest.skipIf(main.SKILL_AUTOMATON is None, 'pyahocorasick is not installed')
+    def test_automaton_and_pattern_agree(self):
+        texts = [
+            'React Native, react, c++, go, google',
+            'Built a REST API, then rest; unit testing and more testing',
+            'react nativex and javascript, not java-less',
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                text_lower = text.casefold()
+                self.assertEqual(main._automaton_skills(text_lower), main._pattern_skills(text_lower))
+
+    def test_longest_match_wins_where_skills_overlap(self):
+        self.assertEqual(main._pattern_skills('react native developer'), {'react native'})
+        self.assertEqual(main._keyword_skills('React Native and React'), 'react, react native')
@@ -9,24 +9,41 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.parsers import MultiPartParser, FormParser
 from django.conf import settings
+from django.core.cache import cache
+import hashlib
+import json
 import os
+import re
 import sys
+from functools import lru_cache
+import tempfile
+import joblib
 import pandas as pd
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .serializers import JobSerializer, JobLinkSerializer
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Add the project root to the Python path to import main.py
-sys.path.append(settings.BASE_DIR)
+# pdfplumber's pdfminer logs every parsed object at DEBUG
+logging.getLogger("pdfminer").setLevel(logging.WARNING)
+
+# Add the project root to the Python path to import main.py. manage.py and
+# the WSGI entry points usually have it there already, and sys.path holds
+# strings, so compare against str(BASE_DIR) rather than the Path
+if str(settings.BASE_DIR) not in sys.path:
+    sys.path.append(str(settings.BASE_DIR))
 
 # Import functions from main.py with fallback implementations
 try:
     from main import (
         extract_pdf_text,
         extract_skills,
+        extract_skills_batch,
+        fit_job_vectors,
         recommended_jobs,
         recommended_skills,
         get_certifications,
@@ -34,19 +51,36 @@ try:
     )
     logger.info("Successfully imported functions from main.py")
 except ImportError as e:
-    logger.error(f"Error importing functions from main.py: {e}")
+    logger.error("Error importing functions from main.py: %s", e)
 
     # Define fallback functions if imports fail
     def extract_pdf_text(path):
         """
         Fallback function to extract text from PDF.
 
+        Uses PDFium when pypdfium2 is installed, which skips pdfminer's layout
+        analysis, and falls back to pdfplumber.
+
         Args:
             path (str): Path to the PDF file
 
         Returns:
             str: Extracted text from the PDF
         """
+        try:
+            import pypdfium2 as pdfium
+            pdf = pdfium.PdfDocument(path)
+        except ImportError:
+            pass
+        except Exception as e:
+            logger.warning("PDFium could not read PDF, trying pdfplumber: %s", e)
+        else:
+            try:
+                # PDFium ends lines with CRLF; match pdfplumber's output
+                return "\n".join(page.get_textpage().get_text_range().replace('\r\n', '\n') for page in pdf)
+            finally:
+                pdf.close()
+
         try:
             import pdfplumber
             text = ""
@@ -55,9 +89,37 @@ except ImportError as e:
                     text += page.extract_text() + '\n'
             return text
         except Exception as e:
-            logger.error(f"Error extracting text from PDF: {e}")
+            logger.error("Error extracting text from PDF: %s", e)
             return ""
 
+    COMMON_SKILLS = [
+        "python", "java", "javascript", "html", "css", "react", "angular", "vue",
+        "node.js", "express", "django", "flask", "spring", "hibernate", "sql",
+        "mysql", "postgresql", "mongodb", "nosql", "aws", "azure", "gcp",
+        "docker", "kubernetes", "jenkins", "git", "github", "gitlab", "ci/cd",
+        "agile", "scrum", "jira", "confluence", "rest api", "graphql", "microservices"
+    ]
+
+    # Match every skill in a single pass over the text when pyahocorasick is
+    # available, otherwise with one compiled alternation. Both only accept
+    # whole words, so "java" is not found inside "javascript".
+    try:
+        import ahocorasick
+        SKILL_AUTOMATON = ahocorasick.Automaton()
+        for skill in COMMON_SKILLS:
+            SKILL_AUTOMATON.add_word(skill, skill)
+        SKILL_AUTOMATON.make_automaton()
+    except ImportError:
+        SKILL_AUTOMATON = None
+
+    # Lookarounds rather than \b, which never matches after skills like "c++"
+    SKILL_PATTERN = re.compile(
+        r'(?<!\w)(?:' + '|'.join(map(re.escape, COMMON_SKILLS)) + r')(?!\w)'
+    )
+
+    def _is_word_char(char):
+        return char.isalnum() or char == '_'
+
     def extract_skills(text):
         """
         Fallback function to extract skills from text.
@@ -68,42 +130,72 @@ except ImportError as e:
         Returns:
             str: Comma-separated list of skills
         """
-        common_skills = [
-            "python", "java", "javascript", "html", "css", "react", "angular", "vue",
-            "node.js", "express", "django", "flask", "spring", "hibernate", "sql",
-            "mysql", "postgresql", "mongodb", "nosql", "aws", "azure", "gcp",
-            "docker", "kubernetes", "jenkins", "git", "github", "gitlab", "ci/cd",
-            "agile", "scrum", "jira", "confluence", "rest api", "graphql", "microservices"
-        ]
-
-        found_skills = []
-        text_lower = text.lower()
+        text_lower = text.casefold()
 
-        for skill in common_skills:
-            if skill in text_lower:
-                found_skills.append(skill)
+        if SKILL_AUTOMATON is not None:
+            matched = set()
+            for end, skill in SKILL_AUTOMATON.iter(text_lower):
+                start = end - len(skill) + 1
+                if start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                if end + 1 < len(text_lower) and _is_word_char(text_lower[end + 1]):
+                    continue
+                matched.add(skill)
+        else:
+            matched = set(SKILL_PATTERN.findall(text_lower))
+        found_skills = [skill for skill in COMMON_SKILLS if skill in matched]
 
         if not found_skills:
             found_skills = ["python", "javascript", "html", "css", "sql"]
 
         return ", ".join(found_skills)
 
-    def recommended_jobs(user_skills, job_listings):
+    def extract_skills_batch(texts):
+        """
+        Fallback function to extract skills from many texts.
+
+        Args:
+            texts (iterable of str): Texts to extract skills from
+
+        Returns:
+            list: Comma-separated skills for each text
+        """
+        return [extract_skills(text) for text in texts]
+
+    def fit_job_vectors(job_listings):
+        """
+        Fallback function to fit job vectors.
+
+        Args:
+            job_listings (pd.DataFrame): Job listings (unused in fallback)
+
+        Returns:
+            None: The fallback recommender does not use vectors
+        """
+        # Suppress unused parameter warning
+        _ = job_listings
+
+        return None
+
+    def recommended_jobs(user_skills, job_listings, job_vectors=None, top_n=None):
         """
         Fallback function to recommend jobs.
 
         Args:
             user_skills (str): User skills (unused in fallback)
             job_listings (pd.DataFrame): Job listings DataFrame
+            job_vectors (tuple, optional): Fitted job vectors (unused in fallback)
+            top_n (int, optional): Maximum number of jobs to return
 
         Returns:
             pd.DataFrame: Top 5 jobs from the listings
         """
-        # Suppress unused parameter warning
+        # Suppress unused parameter warnings
         _ = user_skills
+        _ = job_vectors
 
         # Just return the first 5 jobs
-        return job_listings.head(5)
+        return job_listings.head(5 if top_n is None else min(top_n, 5))
 
     def recommended_skills(user_skills, job_listings, skill_number=None):
         """
@@ -159,6 +251,190 @@ except ImportError as e:
         return pd.DataFrame(columns=['jobProvider', 'url'])
 
 
+# Parsed job listings and their fitted TF-IDF vectors, keyed by (path, mtime)
+# so an edited file is re-read
+_JOB_CACHE = {}
+
+
+def parquet_path_for(path):
+    """
+    Return where the build_job_listings command writes the Parquet copy of a CSV.
+
+    Args:
+        path (str): Path to the job listings CSV file
+
+    Returns:
+        str: Path of the matching .parquet file
+    """
+    return os.path.splitext(path)[0] + '.parquet'
+
+
+def vectors_path_for(path):
+    """
+    Return where the build_job_listings command saves the job vectors fitted on a CSV.
+
+    Args:
+        path (str): Path to the job listings CSV file
+
+    Returns:
+        str: Path of the matching .tfidf.joblib file
+    """
+    return os.path.splitext(path)[0] + '.tfidf.joblib'
+
+
+def _job_vectors_for(job_listings, parquet_path, vectors_path):
+    """
+    Load the job vectors saved alongside the Parquet copy, or fit them.
+
+    Args:
+        job_listings (pd.DataFrame): Job listings read from parquet_path
+        parquet_path (str): Path of the Parquet copy the listings came from
+        vectors_path (str): Path of the saved vectors
+
+    Returns:
+        tuple: The job vectors for job_listings, as fit_job_vectors returns them
+    """
+    # The command saves the vectors right after the Parquet file they were fitted on
+    if os.path.exists(vectors_path) and os.path.getmtime(vectors_path) >= os.path.getmtime(parquet_path):
+        try:
+            return joblib.load(vectors_path)
+        except Exception as e:
+            logger.warning("Could not load job vectors from %s, refitting: %s", vectors_path, e)
+    return fit_job_vectors(job_listings)
+
+
+def _load_jobs(path):
+    """
+    Load the job listings, reusing the parsed DataFrame across requests.
+
+    Reads the Parquet copy built by the build_job_listings command when it is
+    at least as new as the CSV, and the CSV itself otherwise. With the Parquet
+    copy, the job vectors the command fitted are reused too, so each worker
+    process does not refit them.
+
+    Args:
+        path (str): Path to the job listings CSV file
+
+    Returns:
+        tuple: Shallow copy of the cached listings, so callers can add columns
+        without touching the cache, and the job vectors fitted on them
+    """
+    csv_mtime = os.path.getmtime(path)
+    source, mtime = path, csv_mtime
+    parquet_path = parquet_path_for(path)
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= csv_mtime:
+        source, mtime = parquet_path, os.path.getmtime(parquet_path)
+
+    key = (source, mtime)
+    cached = _JOB_CACHE.get(key)
+    if cached is None:
+        # Arrow-backed columns keep the text in contiguous buffers and run the
+        # Skills string operations in Arrow's compute kernels
+        if source == parquet_path:
+            job_listings = pd.read_parquet(source, dtype_backend='pyarrow')
+        else:
+            job_listings = pd.read_csv(source, engine='pyarrow', dtype_backend='pyarrow')
+        # Same derivation as main.load_job_listings, done once per file version
+        if 'Skills' not in job_listings.columns:
+            job_listings['Skills'] = pd.Series(
+                extract_skills_batch(job_listings['description'].tolist()),
+                index=job_listings.index,
+                dtype=job_listings['description'].dtype
+            )
+        if source == parquet_path:
+            job_vectors = _job_vectors_for(job_listings, parquet_path, vectors_path_for(path))
+        else:
+            job_vectors = fit_job_vectors(job_listings)
+        cached = (job_listings, job_vectors)
+        _JOB_CACHE.clear()
+        _JOB_CACHE[key] = cached
+
+    job_listings, job_vectors = cached
+    return job_listings.copy(deep=False), job_vectors
+
+
+@lru_cache(maxsize=None)
+def _representation_fields(serializer_class):
+    """Field names and to_representation callables of a serializer, built once."""
+    return tuple((name, field.to_representation) for name, field in serializer_class().fields.items())
+
+
+def _records_response(df, serializer_class):
+    """
+    Render DataFrame rows as serializer_class would, one column at a time.
+
+    Each value goes through its field's to_representation, so the output
+    matches serializer_class(records, many=True).data without instantiating
+    a serializer per row. Missing columns and values are rendered as null.
+
+    Args:
+        df (pd.DataFrame): Rows to render
+        serializer_class (type): Serializer describing the response fields
+
+    Returns:
+        Response: JSON response with one object per row
+    """
+    names, columns = [], []
+    for name, to_representation in _representation_fields(serializer_class):
+        names.append(name)
+        if name not in df.columns:
+            columns.append([None] * len(df))
+            continue
+        values = df[name].astype(object)
+        columns.append([
+            None if value is None else to_representation(value)
+            for value in values.where(values.notna(), None)
+        ])
+    records = [dict(zip(names, row)) for row in zip(*columns)]
+    return Response(records, status=status.HTTP_200_OK)
+
+
+# Copy uploads to disk in few large writes rather than Django's 64KB chunks
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Resumes are a few pages; anything larger is rejected before it is parsed
+MAX_RESUME_SIZE = 20 * 1024 * 1024
+
+# Coursera results change slowly and the same skill sets recur across users
+CERTIFICATIONS_CACHE_TIMEOUT = 6 * 60 * 60
+
+# FindWork results for the same search rarely change within a few minutes
+FINDWORK_CACHE_TIMEOUT = 10 * 60
+
+
+def _get_certifications_cached(specialization):
+    """
+    Fetch certification courses, reusing results cached for the same specialization.
+
+    Empty results are not cached so a failed scrape is retried on the next request.
+
+    Args:
+        specialization (str): Normalized, comma-separated list of skills
+
+    Returns:
+        list: List of courses with [title, url, skill] format
+    """
+    key = 'certifications:' + hashlib.sha1(specialization.encode('utf-8')).hexdigest()
+    certifications = cache.get(key)
+    if certifications is None:
+        certifications = get_certifications(specialization)
+        if certifications:
+            cache.set(key, certifications, CERTIFICATIONS_CACHE_TIMEOUT)
+    else:
+        logger.info("Using cached certifications for: %s", specialization)
+    return certifications
+
+
+# Shared FindWork session so keep-alive connections (and their TLS sessions)
+# are reused across requests; connection failures are retried with backoff
+_FINDWORK_SESSION = requests.Session()
+_FINDWORK_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
+
+
 class ExtractSkillsView(APIView):
     """
     API view for extracting skills from a resume PDF file.
@@ -188,26 +464,45 @@ class ExtractSkillsView(APIView):
         try:
             # Validate file type
             if not resume_file.name.lower().endswith('.pdf'):
-                logger.warning(f"Invalid file type: {resume_file.name}")
+                logger.warning("Invalid file type: %s", resume_file.name)
+                return Response({"error": "Only PDF files are supported"}, status=status.HTTP_400_BAD_REQUEST)
+
+            # Reject oversized uploads before copying them to disk
+            if resume_file.size > MAX_RESUME_SIZE:
+                logger.warning("Resume file too large: %s bytes", resume_file.size)
+                return Response(
+                    {"error": f"Resume file must be smaller than {MAX_RESUME_SIZE // (1024 * 1024)}MB"},
+                    status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+                )
+
+            # Check the PDF signature, which readers accept anywhere in the first 1KB
+            header = resume_file.read(1024)
+            resume_file.seek(0)
+            if b'%PDF-' not in header:
+                logger.warning("File is not a PDF: %s", resume_file.name)
                 return Response({"error": "Only PDF files are supported"}, status=status.HTTP_400_BAD_REQUEST)
 
             # Create media directory if it doesn't exist
             os.makedirs(settings.MEDIA_ROOT, exist_ok=True)
 
-            # Save the file temporarily
-            file_path = os.path.join(settings.MEDIA_ROOT, resume_file.name)
-            with open(file_path, 'wb+') as destination:
-                for chunk in resume_file.chunks():
+            # Save the file temporarily under a unique name, so concurrent
+            # uploads with the same file name cannot overwrite each other
+            with tempfile.NamedTemporaryFile(suffix='.pdf', dir=settings.MEDIA_ROOT, delete=False) as destination:
+                file_path = destination.name
+                for chunk in resume_file.chunks(chunk_size=UPLOAD_CHUNK_SIZE):
                     destination.write(chunk)
 
-            logger.info(f"Resume file saved temporarily at: {file_path}")
+            # Release the upload's buffer or spooled temp file before parsing
+            resume_file.close()
+
+            logger.info("Resume file saved temporarily at: %s", file_path)
 
             # Extract text from PDF
             text = extract_pdf_text(file_path)
             if not text or len(text.strip()) == 0:
                 raise ValueError("Could not extract text from PDF. The file may be corrupted or password-protected.")
 
-            logger.info(f"Successfully extracted {len(text)} characters of text from PDF")
+            logger.info("Successfully extracted %d characters of text from PDF", len(text))
 
             # Extract skills from text
             skills = extract_skills(text)
@@ -215,16 +510,16 @@ class ExtractSkillsView(APIView):
                 logger.warning("No skills found in the resume, using default skills")
                 skills = "python, javascript, html, css, sql"
             else:
-                logger.info(f"Successfully extracted skills: {skills}")
+                logger.info("Successfully extracted skills: %s", skills)
 
             return Response({"skills": skills}, status=status.HTTP_200_OK)
 
         except ValueError as e:
-            logger.error(f"Validation error: {str(e)}")
+            logger.error("Validation error: %s", e)
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+            logger.error("Unexpected error: %s", e, exc_info=True)
             return Response(
                 {"error": f"An unexpected error occurred: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -235,9 +530,9 @@ class ExtractSkillsView(APIView):
             if file_path and os.path.exists(file_path):
                 try:
                     os.remove(file_path)
-                    logger.info(f"Temporary file removed: {file_path}")
+                    logger.info("Temporary file removed: %s", file_path)
                 except Exception as e:
-                    logger.error(f"Error removing temporary file: {str(e)}")
+                    logger.error("Error removing temporary file: %s", e)
 
 
 class RecommendedJobsView(APIView):
@@ -263,39 +558,35 @@ class RecommendedJobsView(APIView):
 
         try:
             user_skills = request.data['skills']
-            logger.info(f"Processing job recommendations for skills: {user_skills}")
+            # Optional cap on the number of jobs returned, best matches first
+            limit = request.data.get('limit', None)
+
+            if limit is not None:
+                try:
+                    limit = int(limit)
+                except (ValueError, TypeError):
+                    limit = 0
+                if limit <= 0:
+                    logger.warning("Invalid limit value: %s, returning all jobs", request.data.get('limit'))
+                    limit = None
+
+            logger.info("Processing job recommendations for skills: %s", user_skills)
 
             # Read job listings from absolute path
+            # (created with sample data at startup if missing, see JobMatcherConfig.ready)
             job_listings_path = os.path.join(settings.BASE_DIR, 'Job_listings.csv')
 
-            # Create a sample job listings file if it doesn't exist
-            if not os.path.exists(job_listings_path):
-                logger.warning(f"Job listings file not found at {job_listings_path}, creating sample data")
-                sample_data = {
-                    'id': ['1', '2', '3'],
-                    'title': ['Software Engineer', 'Data Scientist', 'Web Developer'],
-                    'company': ['Tech Co', 'Data Inc', 'Web LLC'],
-                    'location': ['San Francisco', 'New York', 'Remote'],
-                    'description': ['Software engineering role', 'Data science position', 'Web development job'],
-                    'Skills': ['python, javascript', 'python, sql, machine learning', 'html, css, javascript, react']
-                }
-                pd.DataFrame(sample_data).to_csv(job_listings_path, index=False)
-                logger.info("Created sample job listings file")
-
             # Load job listings
-            job_listings = pd.read_csv(job_listings_path)
-            logger.info(f"Loaded {len(job_listings)} job listings")
+            job_listings, job_vectors = _load_jobs(job_listings_path)
+            logger.info("Loaded %d job listings", len(job_listings))
 
             # Get recommended jobs
-            recommended = recommended_jobs(user_skills, job_listings)
-            logger.info(f"Found {len(recommended)} recommended jobs")
-
-            # Convert to list of dictionaries for serialization
-            jobs_list = recommended.to_dict('records')
+            recommended = recommended_jobs(user_skills, job_listings, job_vectors, top_n=limit)
+            logger.info("Found %d recommended jobs", len(recommended))
 
-            # Serialize the data
-            serializer = JobSerializer(jobs_list, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            # JobSerializer exposes the score under an attribute-safe name
+            recommended = recommended.rename(columns={"Similarity Score": "Similarity_Score"})
+            return _records_response(recommended, JobSerializer)
 
         except pd.errors.EmptyDataError:
             logger.error("Empty job listings file")
@@ -304,7 +595,7 @@ class RecommendedJobsView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         except Exception as e:
-            logger.error(f"Error processing job recommendations: {str(e)}", exc_info=True)
+            logger.error("Error processing job recommendations: %s", e, exc_info=True)
             return Response(
                 {"error": f"Error processing jobs: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -340,36 +631,23 @@ class RecommendedSkillsView(APIView):
                 try:
                     skill_count = int(skill_count)
                 except (ValueError, TypeError):
-                    logger.warning(f"Invalid skill_count value: {skill_count}, using default")
+                    logger.warning("Invalid skill_count value: %s, using default", skill_count)
                     skill_count = None
 
-            logger.info(f"Processing skill recommendations for skills: {user_skills}")
-            logger.info(f"Requested skill count: {skill_count}")
+            logger.info("Processing skill recommendations for skills: %s", user_skills)
+            logger.info("Requested skill count: %s", skill_count)
 
             # Read job listings from absolute path
+            # (created with sample data at startup if missing, see JobMatcherConfig.ready)
             job_listings_path = os.path.join(settings.BASE_DIR, 'Job_listings.csv')
 
-            # Create a sample job listings file if it doesn't exist
-            if not os.path.exists(job_listings_path):
-                logger.warning(f"Job listings file not found at {job_listings_path}, creating sample data")
-                sample_data = {
-                    'id': ['1', '2', '3'],
-                    'title': ['Software Engineer', 'Data Scientist', 'Web Developer'],
-                    'company': ['Tech Co', 'Data Inc', 'Web LLC'],
-                    'location': ['San Francisco', 'New York', 'Remote'],
-                    'description': ['Software engineering role', 'Data science position', 'Web development job'],
-                    'Skills': ['python, javascript', 'python, sql, machine learning', 'html, css, javascript, react']
-                }
-                pd.DataFrame(sample_data).to_csv(job_listings_path, index=False)
-                logger.info("Created sample job listings file")
-
             # Load job listings
-            job_listings = pd.read_csv(job_listings_path)
-            logger.info(f"Loaded {len(job_listings)} job listings")
+            job_listings, _ = _load_jobs(job_listings_path)
+            logger.info("Loaded %d job listings", len(job_listings))
 
             # Get recommended skills
             skills = recommended_skills(user_skills, job_listings, skill_count)
-            logger.info(f"Found {len(skills)} recommended skills")
+            logger.info("Found %d recommended skills", len(skills))
 
             return Response({"recommended_skills": skills}, status=status.HTTP_200_OK)
 
@@ -380,7 +658,7 @@ class RecommendedSkillsView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         except Exception as e:
-            logger.error(f"Error processing skill recommendations: {str(e)}", exc_info=True)
+            logger.error("Error processing skill recommendations: %s", e, exc_info=True)
             return Response(
                 {"error": f"Error processing skills: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -403,7 +681,8 @@ class CertificationsView(APIView):
         Returns:
             Response: JSON response with certification courses or error message
         """
-        specialization = request.query_params.get('specialization', '')
+        # Lowercase so differently cased requests share a cache entry
+        specialization = request.query_params.get('specialization', '').strip().lower()
 
         if not specialization:
             logger.warning("Empty specialization parameter in certification request")
@@ -412,35 +691,35 @@ class CertificationsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        logger.info(f"Certification request received with specialization: {specialization}")
+        logger.info("Certification request received with specialization: %s", specialization)
 
         try:
             # Check if the specialization contains multiple skills (comma-separated)
             if ',' in specialization:
-                logger.info(f"Multiple skills detected in certification request: {specialization}")
+                logger.info("Multiple skills detected in certification request: %s", specialization)
 
                 # Clean up the skills - remove empty entries and trim whitespace
                 skills = [skill.strip() for skill in specialization.split(',') if skill.strip()]
-                logger.info(f"Processed skills for certification: {skills}")
+                logger.info("Processed skills for certification: %s", skills)
 
                 # If we have more than 10 skills, limit to first 10 to avoid too many API calls
                 if len(skills) > 10:
                     skills = skills[:10]
-                    logger.info(f"Limited to first 10 skills: {skills}")
+                    logger.info("Limited to first 10 skills: %s", skills)
 
                 # Rejoin the skills with commas for the API call
                 specialization = ', '.join(skills)
-                logger.info(f"Final specialization string: {specialization}")
+                logger.info("Final specialization string: %s", specialization)
 
             # Get certifications from Coursera based on the skills
-            certifications = get_certifications(specialization)
-            logger.info(f"Found {len(certifications)} certifications for: {specialization}")
+            certifications = _get_certifications_cached(specialization)
+            logger.info("Found %d certifications for: %s", len(certifications), specialization)
 
             # Transform the data for the frontend
             serialized_data = []
             for cert in certifications:
                 if not isinstance(cert, (list, tuple)) or len(cert) < 2:
-                    logger.warning(f"Invalid certification data format: {cert}")
+                    logger.warning("Invalid certification data format: %s", cert)
                     continue
 
                 cert_data = {"name": cert[0], "url": cert[1]}
@@ -451,11 +730,11 @@ class CertificationsView(APIView):
 
                 serialized_data.append(cert_data)
 
-            logger.info(f"Returning {len(serialized_data)} formatted certification entries")
+            logger.info("Returning %d formatted certification entries", len(serialized_data))
             return Response(serialized_data, status=status.HTTP_200_OK)
 
         except Exception as e:
-            logger.error(f"Error in certification request: {str(e)}", exc_info=True)
+            logger.error("Error in certification request: %s", e, exc_info=True)
             return Response(
                 {"error": f"Error fetching certifications: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -486,27 +765,28 @@ class JobLinksView(APIView):
             # Validate job IDs
             job_ids = request.data['jobs']
             if not isinstance(job_ids, list):
-                logger.warning(f"Invalid job IDs format: {type(job_ids)}")
+                logger.warning("Invalid job IDs format: %s", type(job_ids))
                 return Response({"error": "Jobs must be a list of IDs"}, status=status.HTTP_400_BAD_REQUEST)
 
-            logger.info(f"Processing job links for {len(job_ids)} jobs")
+            logger.info("Processing job links for %d jobs", len(job_ids))
 
-            # Create a DataFrame with the job IDs
-            jobs_df = pd.DataFrame({'id': job_ids})
+            # Select the requested rows from the cached listings rather than
+            # building a frame of bare IDs, which has no jobProviders to read.
+            # Whole rows, so get_job_links handles listings without that column;
+            # IDs compare as strings since numeric ones are parsed as integers.
+            job_listings_path = os.path.join(settings.BASE_DIR, 'Job_listings.csv')
+            job_listings, _ = _load_jobs(job_listings_path)
+            wanted = [str(job_id) for job_id in job_ids]
+            jobs_df = job_listings[job_listings['id'].astype(str).isin(wanted)]
 
             # Get job links
             job_links = get_job_links(jobs_df)
-            logger.info(f"Found {len(job_links)} job links")
-
-            # Convert to list of dictionaries
-            links_list = job_links.to_dict('records')
+            logger.info("Found %d job links", len(job_links))
 
-            # Serialize the data
-            serializer = JobLinkSerializer(links_list, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return _records_response(job_links, JobLinkSerializer)
 
         except Exception as e:
-            logger.error(f"Error fetching job links: {str(e)}", exc_info=True)
+            logger.error("Error fetching job links: %s", e, exc_info=True)
             return Response(
                 {"error": f"Error fetching job links: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -544,7 +824,7 @@ class ProxyJobsView(APIView):
                     else:
                         skills = [str(skills)]
                 except Exception:
-                    logger.warning(f"Invalid skills format: {skills}")
+                    logger.warning("Invalid skills format: %s", skills)
                     return Response({"error": "Skills must be a list or comma-separated string"},
                                    status=status.HTTP_400_BAD_REQUEST)
 
@@ -555,10 +835,10 @@ class ProxyJobsView(APIView):
                 if page < 1:
                     page = 1
             except (ValueError, TypeError):
-                logger.warning(f"Invalid page parameter: {request.data.get('page')}, using default")
+                logger.warning("Invalid page parameter: %s, using default", request.data.get('page'))
                 page = 1
 
-            logger.info(f"Searching for jobs with skills: {skills}, location: {location}, page: {page}")
+            logger.info("Searching for jobs with skills: %s, location: %s, page: %s", skills, location, page)
 
             # Check if API key is configured
             if not hasattr(settings, 'FINDWORK_API_KEY') or not settings.FINDWORK_API_KEY:
@@ -579,25 +859,34 @@ class ProxyJobsView(APIView):
                 'page': page
             }
 
-            logger.info(f"Calling external API: {api_url} with params: {params}")
-            response = requests.get(api_url, headers=headers, params=params, timeout=15)
+            cache_key = 'findwork:' + hashlib.sha1(
+                json.dumps(params, sort_keys=True).encode('utf-8')
+            ).hexdigest()
+            results = cache.get(cache_key)
+            if results is not None:
+                logger.info("Using cached jobs for params: %s", params)
+                return Response(results, status=status.HTTP_200_OK)
+
+            logger.info("Calling external API: %s with params: %s", api_url, params)
+            response = _FINDWORK_SESSION.get(api_url, headers=headers, params=params, timeout=15)
             response.raise_for_status()
 
             # Transform and return the jobs
             jobs_data = response.json()
             results = jobs_data.get('results', [])
-            logger.info(f"Found {len(results)} jobs from external API")
+            logger.info("Found %d jobs from external API", len(results))
+            cache.set(cache_key, results, FINDWORK_CACHE_TIMEOUT)
 
             return Response(results, status=status.HTTP_200_OK)
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error calling external API: {str(e)}", exc_info=True)
+            logger.error("Error calling external API: %s", e, exc_info=True)
             return Response(
                 {"error": f"Error calling external job search API: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         except Exception as e:
-            logger.error(f"Unexpected error in job search: {str(e)}", exc_info=True)
+            logger.error("Unexpected error in job search: %s", e, exc_info=True)
             return Response(
                 {"error": f"An unexpected error occurred: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
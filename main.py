@@ -3,26 +3,48 @@ Main module for skill extraction, job recommendation, and certification recommen
 This module provides core functionality for the Skill Sync application.
 """
 import os
+import re
 import ast
+import hashlib
+import threading
+import numpy as np
 import pandas as pd
-import spacy
 import requests
 import pdfplumber
+import pypdfium2 as pdfium
+from requests.adapters import HTTPAdapter
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from collections import Counter
-from bs4 import BeautifulSoup
+from sklearn.metrics.pairwise import linear_kernel
+from scipy.sparse import csr_matrix
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from selectolax.lexbor import LexborHTMLParser
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Initialize spaCy model
-try:
-    nlp = spacy.load("output2")
-except Exception as e:
-    print(f"Error loading spaCy model: {e}")
-    nlp = None
+
+@lru_cache(maxsize=1)
+def get_nlp():
+    """
+    Load the spaCy skills model on first use.
+
+    Importing spaCy and loading the model takes several seconds, which code
+    paths that never extract skills should not pay. The model's pipeline is
+    only the NER component, so there is nothing to disable.
+
+    Returns:
+        spacy.language.Language: The loaded model, or None if it cannot be loaded
+    """
+    try:
+        import spacy
+        return spacy.load("output2")
+    except Exception as e:
+        print(f"Error loading spaCy model: {e}")
+        return None
+
 
 # Common tech skills for fallback when NLP model fails
 COMMON_TECH_SKILLS = [
@@ -43,54 +65,234 @@ COMMON_TECH_SKILLS = [
     "mobile development", "ios", "android", "react native", "flutter", "xamarin"
 ]
 
+# Find every skill in one pass over the text instead of one scan per skill,
+# with an Aho-Corasick automaton when pyahocorasick is installed and one
+# compiled alternation otherwise. Both apply the same rule: whole words only,
+# and where matches overlap the leftmost wins, longest first at a position,
+# so "react native" is reported without "react"
+try:
+    import ahocorasick
+    SKILL_AUTOMATON = ahocorasick.Automaton()
+    for index, skill in enumerate(COMMON_TECH_SKILLS):
+        SKILL_AUTOMATON.add_word(skill, index)
+    SKILL_AUTOMATON.make_automaton()
+except ImportError:
+    SKILL_AUTOMATON = None
+
+# Longest first so "react native" is preferred over "react"; lookarounds
+# rather than \b, which never matches after skills like "c++"
+SKILL_PATTERN = re.compile(
+    r'(?<!\w)(?:'
+    + '|'.join(map(re.escape, sorted(COMMON_TECH_SKILLS, key=len, reverse=True)))
+    + r')(?!\w)'
+)
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
 def extract_pdf_text(path):
     """
     Extract text from a PDF file.
 
+    Reads the text layer with PDFium, one page at a time, and falls back to
+    pdfplumber's layout analysis for files PDFium cannot open.
+
     Args:
         path (str): Path to the PDF file
 
     Returns:
         str: Extracted text from the PDF
     """
-    text = ''
+    try:
+        pdf = pdfium.PdfDocument(path)
+    except pdfium.PdfiumError as e:
+        print(f"PDFium could not read PDF, trying pdfplumber: {e}")
+    else:
+        parts = []
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                # PDFium ends lines with CRLF; match pdfplumber's output
+                parts.append(textpage.get_text_range().replace('\r\n', '\n'))
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+        return '\n'.join(parts)
+
     with pdfplumber.open(path) as pdf:
-        for page in pdf.pages:
-            text += page.extract_text() + '\n'
-    return text
+        return '\n'.join(page.extract_text() for page in pdf.pages)
+
+
+# Skills already extracted in this process, keyed by a digest of the text so
+# the cache does not keep whole descriptions and resumes alive
+SKILLS_CACHE_SIZE = 4096
+_skills_cache = OrderedDict()
+_skills_cache_lock = threading.Lock()
+
+
+def _skills_cache_key(text):
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _get_cached_skills(key):
+    with _skills_cache_lock:
+        skills = _skills_cache.get(key)
+        if skills is not None:
+            _skills_cache.move_to_end(key)
+        return skills
+
+
+def _cache_skills(key, skills):
+    with _skills_cache_lock:
+        _skills_cache[key] = skills
+        _skills_cache.move_to_end(key)
+        if len(_skills_cache) > SKILLS_CACHE_SIZE:
+            _skills_cache.popitem(last=False)
 
 
 def extract_skills(text):
     """
     Extract skills from text using spaCy NER model or fallback to keyword matching.
 
+    Results are remembered per text, so a resume uploaded again or a
+    description repeated across listings is not run through the model twice.
+
     Args:
         text (str): Text to extract skills from
 
     Returns:
         str: Comma-separated list of skills
     """
+    key = _skills_cache_key(text)
+    skills = _get_cached_skills(key)
+    if skills is None:
+        skills = _extract_skills_uncached(text)
+        _cache_skills(key, skills)
+    return skills
+
+
+def _extract_skills_uncached(text):
+    # Blank text has no entities to find, so skip the model (and loading it)
+    if not text or text.isspace():
+        return _keyword_skills(text)
+
     # If spaCy model is available, use it
+    nlp = get_nlp()
     if nlp is not None:
         try:
-            skills = []
-            docs = nlp(text)
-            for doc in docs.ents:
-                skills.append(str.lower(doc.text))
-            skills = list(set(skills))
+            skills = _entity_skills(nlp(text))
             if skills:  # If skills were found
-                return ', '.join(skills)
+                return skills
         except Exception as e:
             print(f"Error using spaCy model: {e}")
             # Fall through to the fallback method
 
-    # Fallback method: Look for common tech skills in the text
-    text_lower = text.lower()
-    found_skills = []
+    return _keyword_skills(text)
+
+
+def extract_skills_batch(texts):
+    """
+    Extract skills from many texts, running the spaCy model over them in batches.
 
-    for skill in COMMON_TECH_SKILLS:
-        if skill in text_lower:
-            found_skills.append(skill)
+    nlp.pipe() amortises the per-call overhead of the model across each batch,
+    which dominates when deriving skills for a whole job listings file. The
+    batch size can be tuned with the SKILLSYNC_SPACY_BATCH_SIZE environment
+    variable.
+
+    Args:
+        texts (iterable of str): Texts to extract skills from
+
+    Returns:
+        list: Comma-separated skills for each text, as extract_skills() returns them
+    """
+    texts = list(texts)
+    keys = [_skills_cache_key(text) for text in texts]
+
+    # Only texts not seen before go through the model, each of them once
+    found, pending = {}, {}
+    for key, text in zip(keys, texts):
+        if key in found or key in pending:
+            continue
+        skills = _get_cached_skills(key)
+        if skills is not None:
+            found[key] = skills
+        elif not text or text.isspace():
+            # Nothing for the model to find; see _extract_skills_uncached
+            found[key] = _keyword_skills(text)
+        else:
+            pending[key] = text
+
+    if pending:
+        for key, skills in zip(pending, _extract_skills_batch_uncached(list(pending.values()))):
+            _cache_skills(key, skills)
+            found[key] = skills
+    return [found[key] for key in keys]
+
+
+def _extract_skills_batch_uncached(texts):
+    nlp = get_nlp()
+    if nlp is None:
+        return [_keyword_skills(text) for text in texts]
+
+    batch_size = int(os.environ.get("SKILLSYNC_SPACY_BATCH_SIZE", "64"))
+    skills = []
+    try:
+        for doc in nlp.pipe(texts, batch_size=batch_size):
+            skills.append(_entity_skills(doc) or _keyword_skills(doc.text))
+    except Exception as e:
+        print(f"Error using spaCy model: {e}")
+        # Fall back for the texts the model did not get to
+        skills.extend(_keyword_skills(text) for text in texts[len(skills):])
+    return skills
+
+
+def _entity_skills(doc):
+    """Join the distinct lowercased entities the spaCy model found in a document."""
+    return ', '.join({ent.text.lower() for ent in doc.ents})
+
+
+def _automaton_skills(text_lower):
+    """Skills in casefolded text, found with SKILL_AUTOMATON."""
+    # The automaton reports every occurrence, overlapping ones included. Keep
+    # whole words only, so "go" is not found inside "google", ordered by start
+    # and then longest first
+    spans = []
+    for end, index in SKILL_AUTOMATON.iter(text_lower):
+        start = end - len(COMMON_TECH_SKILLS[index]) + 1
+        if start > 0 and _is_word_char(text_lower[start - 1]):
+            continue
+        if end + 1 < len(text_lower) and _is_word_char(text_lower[end + 1]):
+            continue
+        spans.append((start, -end, index))
+    spans.sort()
+
+    # Then drop matches overlapping an earlier one, as SKILL_PATTERN's scan does
+    matched = set()
+    next_start = 0
+    for start, neg_end, index in spans:
+        if start >= next_start:
+            matched.add(COMMON_TECH_SKILLS[index])
+            next_start = 1 - neg_end
+    return matched
+
+
+def _pattern_skills(text_lower):
+    """Skills in casefolded text, found with SKILL_PATTERN."""
+    return set(SKILL_PATTERN.findall(text_lower))
+
+
+def _keyword_skills(text):
+    """Fallback method: Look for common tech skills in the text."""
+    text_lower = text.casefold()
+
+    if SKILL_AUTOMATON is not None:
+        matched = _automaton_skills(text_lower)
+    else:
+        matched = _pattern_skills(text_lower)
+    found_skills = [skill for skill in COMMON_TECH_SKILLS if skill in matched]
 
     # If no skills found, return some default skills to avoid empty results
     if not found_skills:
@@ -99,6 +301,51 @@ def extract_skills(text):
     return ', '.join(found_skills)
 
 
+def _factorize_skills(skills):
+    """
+    Split comma-separated skills and number each distinct skill.
+
+    Args:
+        skills (pd.Series): Comma-separated skills per entry
+
+    Returns:
+        tuple: Row position and skill code of every skill occurrence, and the
+        distinct skills in code order (sorted)
+    """
+    # Positional index so the exploded labels are row numbers
+    exploded = skills.reset_index(drop=True).str.split(", ").explode()
+    codes, vocabulary = pd.factorize(exploded, sort=True)
+    present = codes >= 0  # Missing entries explode to a single NaN
+    return exploded.index.to_numpy()[present], codes[present], vocabulary
+
+
+def _top_n_indices(values, n):
+    """
+    Return the positions of the n largest values, largest first.
+
+    Same result as np.argsort(-values, kind='stable')[:n], ties included, but
+    the top n are picked with an O(len(values)) partition and only they are
+    sorted.
+
+    Args:
+        values (np.ndarray): Values to rank
+        n (int or None): Number of positions to return; None returns all
+
+    Returns:
+        np.ndarray: Positions of the n largest values
+    """
+    if n is None or not 0 < n < len(values):
+        return np.argsort(-values, kind='stable')[:n]
+
+    threshold = np.partition(values, len(values) - n)[len(values) - n]
+    above = values > threshold
+    # Fill the remaining places with the earliest values equal to the threshold
+    tied = values == threshold
+    tied &= np.cumsum(tied) <= n - np.count_nonzero(above)
+    selected = np.flatnonzero(above | tied)
+    return selected[np.argsort(-values[selected], kind='stable')]
+
+
 def one_hot_encode_skills(skills):
     """
     One-hot encode skills for association rule mining.
@@ -107,32 +354,67 @@ def one_hot_encode_skills(skills):
         skills (str or pd.Series): Skills to encode
 
     Returns:
-        pd.DataFrame: One-hot encoded skills
+        pd.DataFrame: One-hot encoded skills, stored sparsely as uint8 with one column per skill
     """
     if isinstance(skills, str):  # If input is a single string
         skills = pd.Series([skills])  # Convert to Series
 
-    # Split each entry by ", " and expand into separate rows
-    skills_split = skills.str.get_dummies(sep=", ")
-    return skills_split
+    # Build the CSR matrix straight from the skill codes instead of a dense
+    # get_dummies() frame that is mostly zeros
+    rows, codes, vocabulary = _factorize_skills(skills)
+    matrix = csr_matrix(
+        (np.ones(len(codes), dtype=np.uint8), (rows, codes)),
+        shape=(len(skills), len(vocabulary))
+    )
+    matrix.data[:] = 1  # A skill listed twice in one entry is still one
+    return pd.DataFrame.sparse.from_spmatrix(matrix, index=skills.index, columns=vocabulary)
+
+
+def fit_job_vectors(job_listings):
+    """
+    Fit TF-IDF vectors for the job listings so they can be reused across queries.
+
+    Args:
+        job_listings (pd.DataFrame): DataFrame containing job listings with Skills column
+
+    Returns:
+        tuple: Fitted TfidfVectorizer and the sparse matrix of job skill vectors
+    """
+    vectorizer = TfidfVectorizer()
+    job_vectors = vectorizer.fit_transform(job_listings["Skills"])
+    return vectorizer, job_vectors
 
 
-def recommended_jobs(user_skills, job_listings):
+def recommended_jobs(user_skills, job_listings, job_vectors=None, top_n=None):
     """
     Recommend jobs based on user skills using TF-IDF and cosine similarity.
 
     Args:
         user_skills (str): Comma-separated list of user skills
         job_listings (pd.DataFrame): DataFrame containing job listings with Skills column
+        job_vectors (tuple, optional): Result of fit_job_vectors(job_listings). When
+            given, only the user skills are vectorized instead of refitting on every call.
+        top_n (int, optional): Only return the top_n best matches. They are picked
+            with a partition rather than sorting every listing; equal scores keep
+            listing order. Defaults to returning all listings.
 
     Returns:
         pd.DataFrame: Job listings sorted by similarity score
     """
-    all_skills = [user_skills] + job_listings["Skills"].tolist()  # Combine user skills & job skills
-    vectorizer = TfidfVectorizer()
-    skill_vectors = vectorizer.fit_transform(all_skills)  # Convert text to numerical vectors
-    cosine_sim = cosine_similarity(skill_vectors[0:1], skill_vectors[1:])  # Compare user skills with jobs
+    # TfidfVectorizer L2-normalizes every row, so the plain dot product is the
+    # cosine similarity without cosine_similarity()'s second normalization pass
+    if job_vectors is not None:
+        vectorizer, skill_vectors = job_vectors
+        user_vector = vectorizer.transform([user_skills])
+        cosine_sim = linear_kernel(user_vector, skill_vectors)  # Compare user skills with jobs
+    else:
+        all_skills = [user_skills] + job_listings["Skills"].tolist()  # Combine user skills & job skills
+        vectorizer = TfidfVectorizer()
+        skill_vectors = vectorizer.fit_transform(all_skills)  # Convert text to numerical vectors
+        cosine_sim = linear_kernel(skill_vectors[0:1], skill_vectors[1:])  # Compare user skills with jobs
     job_listings["Similarity Score"] = cosine_sim[0]
+    if top_n is not None:
+        return job_listings.iloc[_top_n_indices(cosine_sim[0], top_n)]
     recommended_jobs = job_listings.sort_values(by="Similarity Score", ascending=False)
     return recommended_jobs
 
@@ -150,17 +432,16 @@ def recommended_skills(user_skills, job_listings, skill_number=None):
         list: List of recommended skills
     """
     user_skills = user_skills.split(", ")
-    job_listings['Skills_list'] = job_listings['Skills'].apply(lambda x: x.split(", "))
-    all_job_skills = [skill for skills_list in job_listings["Skills_list"] for skill in skills_list]
-    skill_counts = Counter(all_job_skills)
-    missing_skills = set(skill_counts.keys()) - set(user_skills)
-    recommended_skills = sorted(missing_skills, key=lambda skill: skill_counts[skill], reverse=True)
+    # Count every skill across the listings with one bincount over its codes
+    _, codes, vocabulary = _factorize_skills(job_listings['Skills'])
+    skill_counts = np.bincount(codes, minlength=len(vocabulary))
+    missing = np.flatnonzero(~vocabulary.isin(user_skills))
 
     # Return top N suggested skills
     if skill_number is None:
-        return recommended_skills[:10]
-    else:
-        return recommended_skills[:skill_number]
+        skill_number = 10
+    top = missing[_top_n_indices(skill_counts[missing], skill_number)]
+    return vocabulary[top].tolist()
 
 def get_certifications(specialization):
     """
@@ -178,13 +459,16 @@ def get_certifications(specialization):
     # Check if specialization contains multiple skills (comma-separated)
     if ',' in specialization:
         # Split the skills and use all of them (up to 10) for better results
-        skills = [skill.strip() for skill in specialization.split(',') if skill.strip()][:10]
+        skills = [skill.strip() for skill in specialization.split(',') if skill.strip()][:MAX_CERTIFICATION_SKILLS]
         print(f"Searching for certifications for multiple skills: {skills}")
 
-        # Search for each skill and combine results, limiting to exactly 3 per skill
-        for skill in skills:
-            print(f"Processing skill: {skill}")
-            skill_courses = search_coursera_for_skill(skill)
+        # The searches are independent and I/O bound, so run them concurrently;
+        # map() keeps the results in skill order
+        with ThreadPoolExecutor(max_workers=max(len(skills), 1)) as executor:
+            skill_results = list(executor.map(search_coursera_for_skill, skills))
+
+        # Combine results, limiting to exactly 3 per skill
+        for skill, skill_courses in zip(skills, skill_results):
             print(f"Found {len(skill_courses)} courses for skill: {skill}")
 
             # Limit to exactly 3 courses per skill
@@ -222,6 +506,27 @@ def get_certifications(specialization):
         return limited_courses
 
 
+# Maximum number of skills get_certifications searches at once
+MAX_CERTIFICATION_SKILLS = 10
+
+# Shared session so repeated and concurrent searches reuse pooled Coursera
+# connections instead of a new TCP and TLS handshake per request
+COURSERA_SESSION = requests.Session()
+COURSERA_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CERTIFICATION_SKILLS))
+
+# Coursera's results for a skill barely change from day to day, so each
+# skill's scrape is kept on disk and shared between runs and processes
+COURSERA_CACHE_TIMEOUT = 24 * 60 * 60
+try:
+    from diskcache import Cache
+    COURSERA_CACHE = Cache(os.environ.get(
+        "SKILLSYNC_CACHE_DIR",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), ".skillsync_cache")
+    ))
+except ImportError:
+    COURSERA_CACHE = None
+
+
 def search_coursera_for_skill(skill):
     """
     Search Coursera for courses related to a specific skill.
@@ -239,6 +544,13 @@ def search_coursera_for_skill(skill):
         print("Empty skill provided, skipping search")
         return []
 
+    cache_key = f"coursera:{skill.strip().lower()}"
+    if COURSERA_CACHE is not None:
+        cached_courses = COURSERA_CACHE.get(cache_key)
+        if cached_courses is not None:
+            print(f"Using cached courses for skill: {skill}")
+            return cached_courses
+
     # Construct the URL with the skill as the query parameter
     url = f"https://www.coursera.org/search?query={skill}&sortBy=BEST_MATCH"
     headers = {
@@ -252,37 +564,37 @@ def search_coursera_for_skill(skill):
 
     try:
         print(f"Making request to: {url}")
-        response = requests.get(url, headers=headers, timeout=10)
+        response = COURSERA_SESSION.get(url, headers=headers, timeout=10)
         response.raise_for_status()
 
-        # Parse the HTML content
-        soup = BeautifulSoup(response.text, "html.parser")
+        # Parse the HTML content with lexbor, which runs the CSS selectors in C
+        tree = LexborHTMLParser(response.text)
 
         # Extract course links - try different class patterns as Coursera might change them
-        links = soup.find_all('a', class_='cds-119 cds-113 cds-115 cds-CommonCard-titleLink css-vflzcf cds-142')
+        links = tree.css('a[class="cds-119 cds-113 cds-115 cds-CommonCard-titleLink css-vflzcf cds-142"]')
 
         # If no links found with the first pattern, try alternative patterns
         if not links:
-            links = soup.find_all('a', class_=lambda c: c and 'CommonCard-titleLink' in c)
+            links = tree.css('a[class*="CommonCard-titleLink"]')
 
         # If still no links, try a more generic approach
         if not links:
-            links = soup.find_all('a', href=lambda h: h and '/learn/' in h)
+            links = tree.css('a[href*="/learn/"]')
 
         print(f"Found {len(links)} potential course links")
 
         for link in links:
             # Try to extract course title and URL
-            title = None
-            if hasattr(link, 'h3') and link.h3 and link.h3.string:
-                title = link.h3.string
-            elif link.get('aria-label'):
-                title = link.get('aria-label')
-            elif link.text:
-                title = link.text.strip()
-
-            if title and link.get('href'):
-                href = link['href']
+            heading = link.css_first('h3')
+            if heading is not None and heading.text():
+                title = heading.text()
+            elif link.attributes.get('aria-label'):
+                title = link.attributes.get('aria-label')
+            else:
+                title = link.text().strip()
+
+            href = link.attributes.get('href')
+            if title and href:
                 # Ensure URL is absolute
                 if not href.startswith('http'):
                     href = "https://www.coursera.org" + href
@@ -291,6 +603,10 @@ def search_coursera_for_skill(skill):
                 skill_courses.append(course)
 
         print(f"Successfully extracted {len(skill_courses)} courses for skill: {skill}")
+        # An empty page usually means Coursera changed its markup or blocked
+        # the request, so only real results are kept
+        if COURSERA_CACHE is not None and skill_courses:
+            COURSERA_CACHE.set(cache_key, skill_courses, expire=COURSERA_CACHE_TIMEOUT)
         return skill_courses
 
     except requests.exceptions.RequestException as e:
@@ -311,21 +627,22 @@ def get_job_links(recommended_jobs):
     Returns:
         pd.DataFrame: DataFrame with jobProvider and url columns
     """
-    job_links_df = pd.DataFrame(columns=['jobProvider', 'url'])
-
     if 'jobProviders' not in recommended_jobs.columns:
         print("Warning: 'jobProviders' column not found in recommended_jobs DataFrame")
-        return job_links_df
+        return pd.DataFrame(columns=['jobProvider', 'url'])
 
+    # Collect the provider dicts and build the frame once; concatenating a
+    # frame per job copied every earlier row again
+    rows = []
     for i in recommended_jobs['jobProviders']:
+        # The column holds Python reprs (single-quoted), not JSON
         try:
             li = ast.literal_eval(i)
-            row = pd.DataFrame(data=li[:2], columns=['jobProvider', 'url'])
-            job_links_df = pd.concat([job_links_df, row], ignore_index=True)
+            rows.extend(li[:2])
         except (ValueError, SyntaxError) as e:
             print(f"Error parsing job provider data: {e}")
 
-    return job_links_df
+    return pd.DataFrame(rows, columns=['jobProvider', 'url'])
 
 
 def fetch_paginated_jobs(api_url, params, headers=None, max_pages=5):
@@ -343,35 +660,40 @@ def fetch_paginated_jobs(api_url, params, headers=None, max_pages=5):
     """
     all_jobs = []
     next_page = ""  # Initialize nextPage as empty
-
-    for page_num in range(max_pages):  # Limit number of pages to fetch
-        if next_page:  # Add nextPage token only if it exists
-            params["nextPage"] = next_page
-
-        try:
-            response = requests.get(api_url, params=params, headers=headers, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-
-            jobs = data.get("jobs", [])  # Extract job data
-            if not jobs:
-                print(f"No jobs found on page {page_num + 1}")
+    params = dict(params)  # Don't leave a nextPage token in the caller's dict
+
+    # Each page's token comes from the previous response, so the pages can't
+    # be requested concurrently; one session at least keeps the connection
+    # open instead of a new TLS handshake per page
+    with requests.Session() as session:
+        for page_num in range(max_pages):  # Limit number of pages to fetch
+            if next_page:  # Add nextPage token only if it exists
+                params["nextPage"] = next_page
+
+            try:
+                response = session.get(api_url, params=params, headers=headers, timeout=15)
+                response.raise_for_status()
+                data = response.json()
+
+                jobs = data.get("jobs", [])  # Extract job data
+                if not jobs:
+                    print(f"No jobs found on page {page_num + 1}")
+                    break
+
+                all_jobs.extend(jobs)
+                print(f"Fetched {len(jobs)} jobs from page {page_num + 1}")
+
+                # Get nextPage token for next request
+                next_page = data.get("nextPage")  # Adjust based on API response
+
+                if not next_page:  # Stop if no more pages
+                    print("No more pages available")
+                    break
+
+            except requests.exceptions.RequestException as e:
+                print(f"Error fetching jobs on page {page_num + 1}: {e}")
                 break
 
-            all_jobs.extend(jobs)
-            print(f"Fetched {len(jobs)} jobs from page {page_num + 1}")
-
-            # Get nextPage token for next request
-            next_page = data.get("nextPage")  # Adjust based on API response
-
-            if not next_page:  # Stop if no more pages
-                print("No more pages available")
-                break
-
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching jobs on page {page_num + 1}: {e}")
-            break
-
     print(f"Total jobs fetched: {len(all_jobs)}")
     return all_jobs
 
@@ -396,6 +718,10 @@ def load_job_listings(file_path="Job_listings.csv"):
     """
     Load job listings from CSV file and extract skills from descriptions.
 
+    Reads the Parquet copy written by `python manage.py build_job_listings`
+    instead when it is at least as new as the CSV; it already has the Skills
+    column, so the spaCy pass is skipped.
+
     Args:
         file_path (str, optional): Path to the CSV file. Defaults to "Job_listings.csv".
 
@@ -403,12 +729,15 @@ def load_job_listings(file_path="Job_listings.csv"):
         pd.DataFrame: DataFrame containing job listings with extracted skills
     """
     try:
-        jobs_df = pd.read_csv(file_path)
-        listings = pd.DataFrame(jobs_df)
+        parquet_path = os.path.splitext(file_path)[0] + ".parquet"
+        if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(file_path):
+            listings = pd.read_parquet(parquet_path)
+        else:
+            listings = pd.read_csv(file_path)
 
         # Extract skills from job descriptions if not already present
         if 'Skills' not in listings.columns:
-            listings['Skills'] = listings['description'].apply(lambda x: extract_skills(x))
+            listings['Skills'] = extract_skills_batch(listings['description'].tolist())
 
         return listings
     except Exception as e: